@@ -1,17 +1,54 @@
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
 import jinja2
 import os
 import pytest
 import responses
 
+NOW = datetime(2024, 1, 3, 12, 0, 0)
 
-@pytest.fixture
+
+@pytest.fixture(scope='session')
 def jinja():
     here = os.path.dirname(__file__)
     template_path = '{}/flash_services/templates'.format(here)
-    return jinja2.Environment(loader=jinja2.FileSystemLoader(template_path))
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(template_path),
+        auto_reload=False,
+        cache_size=-1,
+    )
 
 
-@pytest.fixture
-def mocked_responses():
-    with responses.RequestsMock() as requests_mock:
+@pytest.fixture(scope='session')
+def _requests_mock():
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as requests_mock:
         yield requests_mock
+
+
+@pytest.fixture
+def mocked_responses(_requests_mock):
+    yield _requests_mock
+    _requests_mock.reset()
+
+
+@pytest.fixture
+def log_index(caplog):
+    def _index():
+        messages = defaultdict(set)
+        for record in caplog.records:
+            messages[record.levelno].add(record.getMessage())
+        return messages
+    return _index
+
+
+@pytest.fixture
+def frozen_now(monkeypatch, request):
+    timestamp = getattr(request, 'param', NOW.replace(tzinfo=timezone.utc).timestamp())
+    monkeypatch.setattr('flash_services.utils._now', lambda: timestamp)
+    return timestamp
+
+
+@pytest.fixture(scope='session')
+def two_days_ago():
+    return (NOW - timedelta(days=2, hours=12)).strftime('%Y-%m-%dT%H:%M:%SZ')
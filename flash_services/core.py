@@ -10,6 +10,11 @@ from urllib.parse import urlencode
 import requests
 from dateutil.parser import parse
 
+try:
+    from orjson import loads
+except ImportError:  # pragma: no cover
+    from json import loads
+
 from .utils import provided_args, remove_tags, required_args
 
 logger = logging.getLogger(__name__)
@@ -86,6 +91,15 @@ class Service(metaclass=ServiceMeta):
     TEMPLATE = 'undefined-section'
     """:py:class:`str`: The name of the template to render."""
 
+    TIMEOUT = 10
+    """:py:class:`int`: Seconds to wait for the service API to respond,
+    so a stalled connection can't hold up a poll indefinitely."""
+
+    session = None
+    """:py:class:`requests.Session`: Session to make requests with, to
+    keep connections alive between updates (defaults to ``None``, for a
+    new connection each time)."""
+
     @abstractmethod
     def __init__(self, **kwargs):
         self.service_name = kwargs.get('name')
@@ -93,9 +107,13 @@ class Service(metaclass=ServiceMeta):
     def update(self):
         """Get the current state to display on the dashboard."""
         logger.debug('fetching %s project data', self.FRIENDLY_NAME)
-        response = requests.get(self.url, headers=self.headers)
+        response = (self.session or requests).get(
+            self.url,
+            headers=self.headers,
+            timeout=self.TIMEOUT,
+        )
         if response.status_code == 200:
-            return self.format_data(response.json())
+            return self.format_data(loads(response.content))
         logger.error('failed to update %s project data', self.FRIENDLY_NAME)
         return {}
 
@@ -215,14 +233,14 @@ class ContinuousIntegrationService(Service):
         outcome = build.get('outcome')
         if outcome not in cls.OUTCOMES:
             logger.warning('unknown outcome: %s', outcome)
-        return dict(
-            author=build.get('author') or '<no author>',
-            duration=build.get('duration'),
-            elapsed=build.get('elapsed'),
-            message=build.get('message') or '<no message>',
-            outcome=cls.OUTCOMES.get(outcome),
-            started_at=build.get('started_at'),
-        )
+        return {
+            'author': build.get('author') or '<no author>',
+            'duration': build.get('duration'),
+            'elapsed': build.get('elapsed'),
+            'message': build.get('message') or '<no message>',
+            'outcome': cls.OUTCOMES.get(outcome),
+            'started_at': build.get('started_at'),
+        }
 
 
 class VersionControlService(Service):
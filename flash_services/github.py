@@ -1,15 +1,24 @@
 """Defines the GitHub service integration."""
 
 import logging
-from collections import defaultdict
+import re
+from collections import Counter, OrderedDict
 from datetime import timedelta
+from functools import cached_property
+from hashlib import blake2b
+from statistics import median_low
 
 from .auth import BasicAuthHeaderMixin
-from .core import ContinuousIntegrationService, CustomRootMixin, ThresholdMixin, VersionControlService
-from .utils import elapsed_time, estimate_time, health_summary, naturaldelta, occurred, Outcome, safe_parse
+from .core import (ContinuousIntegrationService, CustomRootMixin, loads, ThresholdMixin,
+                   VersionControlService)
+from .utils import (elapsed_time, estimate_time, health_summary, naturaldelta, occurred, Outcome,
+                    pooled_session, safe_parse)
 
 logger = logging.getLogger(__name__)
 
+SESSION = pooled_session()
+""":py:class:`requests.Session`: Shared by all of the GitHub services."""
+
 
 class GitHub(BasicAuthHeaderMixin, VersionControlService):
     """Show the current status of a GitHub repository.
@@ -29,12 +38,16 @@ class GitHub(BasicAuthHeaderMixin, VersionControlService):
 
     ENDPOINT = '/repos/{repo_name}/commits'
     ROOT = 'https://api.github.com'
+    session = SESSION
 
     def __init__(self, *, account, repo, branch=None, **kwargs):
         super().__init__(**kwargs)
+        self.account = account
         self.repo = repo
         self.branch = branch
         self.repo_name = '{}/{}'.format(account, repo)
+        self._etag = None
+        self._last_data = None
 
     @property
     def name(self):
@@ -57,6 +70,29 @@ class GitHub(BasicAuthHeaderMixin, VersionControlService):
             params['sha'] = self.branch
         return params
 
+    def update(self):
+        """Get the current state to display on the dashboard.
+
+        Note:
+          Uses a conditional request with the ``ETag`` of the previous
+          response; a ``304 Not Modified`` response doesn't count
+          against the rate limit, and the previous data is re-used.
+
+        """
+        logger.debug('fetching %s project data', self.FRIENDLY_NAME)
+        headers = self.headers
+        if self._etag is not None:
+            headers['If-None-Match'] = self._etag
+        response = self.session.get(self.url, headers=headers, timeout=self.TIMEOUT)
+        if response.status_code == 304:
+            return self.format_data(self._last_data)
+        if response.status_code == 200:
+            self._etag = response.headers.get('ETag')
+            self._last_data = loads(response.content)
+            return self.format_data(self._last_data)
+        logger.error('failed to update %s project data', self.FRIENDLY_NAME)
+        return {}
+
     def format_data(self, data):
         """Re-format the response data for the front-end.
 
@@ -102,10 +138,31 @@ class GitHub(BasicAuthHeaderMixin, VersionControlService):
 
 
 class GitHubIssues(ThresholdMixin, GitHub):
-    """Show the current status of GitHub issues and pull requests."""
+    """Show the current status of GitHub issues and pull requests.
+
+    Note:
+      Uses the GraphQL API, so that only the fields required for the
+      summary are transferred.
 
-    ENDPOINT = '/repos/{repo_name}/issues'
+    """
+
+    ENDPOINT = '/graphql'
     FRIENDLY_NAME = 'GitHub Issues'
+    GRAPHQL_QUERY = '''
+        query ($owner: String!, $name: String!) {
+          repository(owner: $owner, name: $name) {
+            issues(first: 100, orderBy: {field: CREATED_AT, direction: DESC}) {
+              nodes { state createdAt closedAt }
+            }
+            pullRequests(first: 100, orderBy: {field: CREATED_AT, direction: DESC}) {
+              nodes { state createdAt closedAt }
+            }
+          }
+        }
+    '''
+    """:py:class:`str`: The GraphQL query for the issue summary."""
+    FORMAT_CACHE_SIZE = 2
+    """:py:class:`int`: How many recently used formatted responses to keep."""
     NEUTRAL_THRESHOLD = 30
     OK_THRESHOLD = 7
     TEMPLATE = 'gh-issues-section'
@@ -113,21 +170,63 @@ class GitHubIssues(ThresholdMixin, GitHub):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.branch = None  # branches aren't relevant for issues
+        self._formatted = OrderedDict()
+        self._query = dict(
+            query=self.GRAPHQL_QUERY,
+            variables=dict(owner=self.account, name=self.repo),
+        )
 
-    @property
-    def url_params(self):
-        params = super().url_params
-        params['state'] = 'all'
-        return params
+    @cached_property
+    def url(self):
+        """The GraphQL endpoint, which doesn't change between updates."""
+        return super().url
+
+    def update(self):
+        logger.debug('fetching %s project data', self.FRIENDLY_NAME)
+        response = self.session.post(
+            self.url,
+            headers=self.headers,
+            json=self._query,
+            timeout=self.TIMEOUT,
+        )
+        if response.status_code == 200:
+            key = (
+                blake2b(response.content, digest_size=16).digest(),
+                self.ok_threshold,
+                self.neutral_threshold,
+            )
+            if key in self._formatted:
+                self._formatted.move_to_end(key)
+                return self._formatted[key]
+            data = loads(response.content)
+            if not data.get('errors'):
+                result = self._formatted[key] = self.format_data(data)
+                while len(self._formatted) > self.FORMAT_CACHE_SIZE:
+                    self._formatted.popitem(last=False)
+                return result
+        logger.error('failed to update %s project data', self.FRIENDLY_NAME)
+        return {}
 
     def format_data(self, data):
-        counts = defaultdict(int)
-        for issue in data:
-            if issue.get('pull_request') is not None:
-                counts['{}-pull-requests'.format(issue['state'])] += 1
-            else:
-                counts['{}-issues'.format(issue['state'])] += 1
-        half_life = self.half_life(data)
+        """Re-format the response data for the front-end.
+
+        Arguments:
+          data (:py:class:`dict`): The JSON data from the response.
+
+        Returns:
+          :py:class:`dict`: The re-formatted data.
+
+        """
+        repository = data['data']['repository']
+        issues = repository['issues']['nodes']
+        pull_requests = repository['pullRequests']['nodes']
+        counts = Counter()
+        for kind, nodes in [('issues', issues), ('pull-requests', pull_requests)]:
+            counts.update(
+                '{}-{}'.format('open' if node['state'] == 'OPEN' else 'closed', kind)
+                for node in nodes
+            )
+        half_life = self.half_life(issues + pull_requests)
         return dict(
             halflife=naturaldelta(half_life),
             health=self.health_summary(half_life),
@@ -148,14 +247,14 @@ class GitHubIssues(ThresholdMixin, GitHub):
         """
         lives = []
         for issue in issues:
-            start = safe_parse(issue.get('created_at'))
-            end = safe_parse(issue.get('closed_at'))
-            if start and end:
+            end = safe_parse(issue.get('closedAt'))
+            if end is None:
+                continue  # still open, so don't bother parsing the start
+            start = safe_parse(issue.get('createdAt'))
+            if start is not None:
                 lives.append(end - start)
         if lives:
-            lives.sort()
-            size = len(lives)
-            return lives[((size + (size % 2)) // 2) - 1]
+            return median_low(lives)
 
     def health_summary(self, half_life):
         """Calculate the health of the service.
@@ -233,10 +332,20 @@ class GitHubEnterprise(CustomRootMixin, GitHub):
 
 
 class GitHubEnterpriseIssues(CustomRootMixin, GitHubIssues):
-    """Issues and pull requests from GHE repositories."""
+    """Issues and pull requests from GHE repositories.
+
+    Note:
+      GHE serves GraphQL at ``/api/graphql``, alongside the ``/api/v3``
+      REST root, so any trailing ``/v3`` is removed from the ``root``.
+
+    """
 
     FRIENDLY_NAME = 'GitHub Issues'
 
+    @cached_property
+    def url(self):
+        return self.url_builder(self.ENDPOINT, root=re.sub(r'/v3/?$', '', self.root))
+
 
 class GitHubEnterpriseActions(CustomRootMixin, GitHubActions):
     """Actions from GHE repositories."""
@@ -1,14 +1,18 @@
 """Defines the Jenkins CI service integration."""
 
 import logging
-import time
+from functools import cached_property
 
+from . import utils
 from .auth import BasicAuthHeaderMixin
 from .core import ContinuousIntegrationService, CustomRootMixin
-from .utils import estimate_time, health_summary, naturaldelta
+from .utils import estimate_time, health_summary, naturaldelta, pooled_session
 
 logger = logging.getLogger(__name__)
 
+SESSION = pooled_session()
+""":py:class:`requests.Session`: Shared by all of the Jenkins services."""
+
 
 class Jenkins(BasicAuthHeaderMixin, CustomRootMixin,
               ContinuousIntegrationService):
@@ -36,6 +40,8 @@ class Jenkins(BasicAuthHeaderMixin, CustomRootMixin,
         'ABORTED': 'cancelled',
     }
 
+    session = SESSION
+
     TREE_PARAMS = 'name,builds[building,timestamp,duration,result,description,changeSets[items[author[fullName],comment]]]'  # pylint: disable=line-too-long
     """:py:class:`str`: Definition of JSON tree to return."""
 
@@ -43,6 +49,11 @@ class Jenkins(BasicAuthHeaderMixin, CustomRootMixin,
         super().__init__(**kwargs)
         self.job = job
 
+    @cached_property
+    def url(self):
+        """The job URL, so the tree parameters are only encoded once."""
+        return super().url
+
     @property
     def url_params(self):
         params = super().url_params
@@ -90,17 +101,17 @@ class Jenkins(BasicAuthHeaderMixin, CustomRootMixin,
         if duration is not None:
             elapsed = 'took {}'.format(naturaldelta(duration))
         else:
-            duration = int(time.time()) - started_at
+            duration = int(utils._now()) - started_at  # pylint: disable=protected-access
             elapsed = 'elapsed time not available'
         author, message = cls._extract_change(build)
-        return super().format_build(dict(
-            author=author,
-            duration=duration,
-            elapsed=elapsed,
-            message=message,
-            outcome=build['result'],
-            started_at=started_at,
-        ))
+        return super().format_build({
+            'author': author,
+            'duration': duration,
+            'elapsed': elapsed,
+            'message': message,
+            'outcome': build['result'],
+            'started_at': started_at,
+        })
 
     @classmethod
     def _extract_change(cls, build):
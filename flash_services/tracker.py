@@ -1,15 +1,17 @@
 """Defines the Pivotal Tracker service integration."""
 
-from collections import defaultdict
 import logging
-
-import requests
+from functools import cached_property
 
 from .auth import HeaderMixin
-from .core import Service
+from .core import Service, loads
+from .utils import pooled_session
 
 logger = logging.getLogger(__name__)
 
+SESSION = pooled_session()
+""":py:class:`requests.Session`: Shared by all of the Tracker services."""
+
 
 class Tracker(HeaderMixin, Service):
     """Show the current status of a Pivotal Tracker project.
@@ -29,12 +31,34 @@ class Tracker(HeaderMixin, Service):
     ROOT = 'https://www.pivotaltracker.com/services/v5'
     TEMPLATE = 'tracker-section'
 
+    session = SESSION
+
     def __init__(self, *, project_id, **kwargs):
         super().__init__(**kwargs)
         self.current_iteration = 0
         self.project_id = project_id
         self.project_version = 0
         self._cached = dict(name='unknown', velocity='unknown')
+        self._etag = None
+
+    @cached_property
+    def headers(self):
+        """The authentication header, which doesn't change between updates."""
+        return super().headers
+
+    @cached_property
+    def url(self):
+        """The project URL, which doesn't change between updates."""
+        return self.url_builder('/projects/{id}', params={'id': self.project_id})
+
+    @cached_property
+    def iteration_url(self):
+        """The iteration URL template, with the query already encoded."""
+        return self.url_builder(
+            '/projects/{id}/iterations/{number}',
+            params={'number': '{number}', 'id': self.project_id},
+            url_params={'fields': ':default,velocity,stories'},
+        )
 
     def details(self, iteration):
         """Update the project data with more details.
@@ -46,14 +70,10 @@ class Tracker(HeaderMixin, Service):
           :py:class:`dict`: Additional detail on the current iteration.
 
         """
-        url = self.url_builder(
-            '/projects/{id}/iterations/{number}',
-            params={'number': iteration, 'id': self.project_id},
-            url_params={'fields': ':default,velocity,stories'},
-        )
-        response = requests.get(url, headers=self.headers)
+        url = self.iteration_url.format(number=iteration)
+        response = self.session.get(url, headers=self.headers, timeout=self.TIMEOUT)
         if response.status_code == 200:
-            return self.format_data(response.json())
+            return self.format_data(loads(response.content))
         else:
             logger.error('failed to update project iteration details')
         return {}
@@ -81,33 +101,52 @@ class Tracker(HeaderMixin, Service):
           stories (:py:class:`list`): A list of stories.
 
         Returns:
-          :py:class:`collections.defaultdict`: Summary of points by
-            story state.
+          :py:class:`dict`: Summary of points by story state.
 
         """
-        result = defaultdict(int)
+        result = {}
         for story in stories:
-            result[story['current_state']] += int(story.get('estimate', 0))
+            state = story['current_state']
+            result[state] = result.get(state, 0) + int(story.get('estimate') or 0)
         return result
 
     def update(self):
-        url = self.url_builder('/projects/{id}', params={'id': self.project_id})
+        """Get the current state to display on the dashboard.
+
+        Note:
+          Uses a conditional request with the ``ETag`` of the previous
+          response; on ``304 Not Modified`` the cached data is re-used
+          without decoding anything.
+
+        """
         logger.debug('fetching Tracker project data')
-        response = requests.get(url, headers=self.headers)
+        headers = self.headers
+        if self._etag is not None:
+            headers = dict(headers, **{'If-None-Match': self._etag})
+        response = self.session.get(self.url, headers=headers, timeout=self.TIMEOUT)
+        if response.status_code == 304:
+            return self._cached
         if response.status_code == 200:
+            etag = response.headers.get('ETag')
             new_version = int(response.headers.get(
                 'X-Tracker-Project-Version', 0,
             ))
-            new_iteration = int(response.json()['current_iteration_number'])
+            raw_data = loads(response.content)
+            new_iteration = int(raw_data['current_iteration_number'])
             if (new_version > self.project_version or
                     new_iteration > self.current_iteration):
-                raw_data = response.json()
                 data = {key: raw_data.get(key) for key in ['name', ]}
                 logger.debug('project updated, fetching iteration details')
-                data.update(self.details(raw_data['current_iteration_number']))
+                details = self.details(raw_data['current_iteration_number'])
+                data.update(details)
+                if not details:
+                    return data  # keep the old state, to retry next poll
+                self.current_iteration = new_iteration
                 self.project_version = new_version
                 self._cached = data
+                self._etag = etag
                 return data
+            self._etag = etag
             return self._cached
         logger.error('failed to update Tracker project data')
         return {}
@@ -1,13 +1,18 @@
 """Defines the Travis CI service integrations."""
 
 import logging
+from functools import cached_property
 
 from .auth import HeaderMixin
 from .core import ContinuousIntegrationService
-from .utils import elapsed_time, estimate_time, health_summary, Outcome
+from .utils import (elapsed_time, estimate_time, health_summary, Outcome,
+                    pooled_session)
 
 logger = logging.getLogger(__name__)
 
+SESSION = pooled_session()
+""":py:class:`requests.Session`: Shared by all of the Travis CI services."""
+
 
 class TravisOS(ContinuousIntegrationService):
     """Show the current status of an open-source project.
@@ -34,14 +39,17 @@ class TravisOS(ContinuousIntegrationService):
     )
     ROOT = 'https://api.travis-ci.org'
 
+    session = SESSION
+
     def __init__(self, *, account, app, **kwargs):
         super().__init__(**kwargs)
         self.account = account
         self.app = app
         self.repo = '{}/{}'.format(account, app)
 
-    @property
+    @cached_property
     def headers(self):
+        """The request headers, which don't change between updates."""
         headers = super().headers
         headers.update({
             'Accept': 'application/vnd.travis-ci.2+json',
@@ -119,3 +127,8 @@ class TravisPro(HeaderMixin, TravisOS):
     def __init__(self, *, api_token, **kwargs):
         api_token = 'token "{}"'.format(api_token)
         super().__init__(api_token=api_token, **kwargs)
+
+    @cached_property
+    def headers(self):
+        """The request headers, including the authentication header."""
+        return super().headers
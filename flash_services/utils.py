@@ -3,10 +3,15 @@
 import logging
 import re
 from datetime import datetime, timezone
-from inspect import Parameter, Signature
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
+from itertools import islice
+from time import time as _now  # patchable, so tests can fix the current time
 
+import requests
 from dateutil.parser import parse
 from humanize import naturaldelta, naturaltime
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +30,18 @@ class Outcome:
     CRASHED = 'crashed'
 
 
+BROKEN_OUTCOMES = frozenset([Outcome.CRASHED, Outcome.FAILED])
+""":py:class:`frozenset`: Outcomes that put a project in an error state."""
+
+
+@lru_cache(maxsize=256)
 def _numeric_words(text):
     """Replace numbers 1-10 with words.
 
+    Note:
+      The humanized phrases come from a small vocabulary (``'5
+      seconds'``, ``'2 days'``, ...), so the rewritten text is cached.
+
     Arguments:
       text (:py:class:`str`): The text to replace numbers in.
 
@@ -35,7 +49,12 @@ def _numeric_words(text):
       :py:class:`str`: The new text containing words.
 
     """
-    return NUMBERS.sub(lambda m: WORDS[m.group()], text)
+    return NUMBERS.sub(_number_word, text)
+
+
+def _number_word(match):
+    """Look up the word for a matched number."""
+    return WORDS[match.group()]
 
 
 def friendlier(func):
@@ -73,14 +92,37 @@ def elapsed_time(start, end):
       :py:class:`tuple`: The start and end times and humanized elapsed
         time.
 
+    """
+    start_time, end_time, text = _elapsed_time(start, end)
+    if text is None:
+        logger.warning('failed to generate elapsed time')
+        text = 'elapsed time not available'
+    return start_time, end_time, text
+
+
+@lru_cache(maxsize=256)
+def _elapsed_time(start, end):
+    """Calculate and describe the elapsed time between two timestamps.
+
+    Note:
+      Finished builds are re-formatted on every poll, and the result
+      doesn't depend on the current time, so it is cached.
+
+    Arguments:
+      start (:py:class:`str`): The activity start time.
+      end (:py:class:`str`): The activity end time.
+
+    Returns:
+      :py:class:`tuple`: The start and end times and humanized elapsed
+        time (``None`` if either time can't be parsed).
+
     """
     start_time = safe_parse(start)
     end_time = safe_parse(end)
     if start_time is None or end_time is None:
-        logger.warning('failed to generate elapsed time')
-        text = 'elapsed time not available'
+        text = None
     else:
-        text = 'took {}'.format(naturaldelta(parse(end) - parse(start)))
+        text = 'took {}'.format(naturaldelta(end_time - start_time))
     return to_utc_timestamp(start_time), to_utc_timestamp(end_time), text
 
 
@@ -117,11 +159,37 @@ def safe_parse(time):
     if time is None:
         return
     try:
-        return parse(time)
+        return _parse_iso(time)
     except (OverflowError, ValueError):
         pass
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso(timestamp):
+    """Parse a timestamp, trying the fast ISO 8601 parser first.
+
+    Note:
+      The same timestamps recur on every poll, so parsed values are
+      cached; the humanized output depends on the current time, so it
+      is not.
+
+    Arguments:
+      timestamp (:py:class:`str`): The string to parse.
+
+    Returns:
+      :py:class:`datetime.datetime`: The parsed datetime.
+
+    Raises:
+      :py:class:`TypeError`: If the timestamp isn't a string.
+      :py:class:`ValueError`: If the timestamp can't be parsed.
+
+    """
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return parse(timestamp)
+
+
 def occurred(at_):
     """Calculate when a service event occurred.
 
@@ -133,15 +201,16 @@ def occurred(at_):
 
     """
     try:
-        occurred_at = parse(at_)
+        occurred_at = _parse_iso(at_)
     except (TypeError, ValueError):
         logger.warning('failed to parse occurrence time %r', at_)
         return 'time not available'
-    utc_now = datetime.now(tz=timezone.utc)
+    now = _now()
+    utc_now = datetime.fromtimestamp(now, tz=timezone.utc)
     try:
         return naturaltime((utc_now - occurred_at).total_seconds())
     except TypeError:  # at_ is a naive datetime
-        return naturaltime((datetime.now() - occurred_at).total_seconds())
+        return naturaltime((datetime.fromtimestamp(now) - occurred_at).total_seconds())
 
 
 def health_summary(builds):
@@ -155,12 +224,11 @@ def health_summary(builds):
 
     """
     for build in builds:
-        if build['outcome'] in {Outcome.PASSED}:
+        outcome = build['outcome']
+        if outcome == Outcome.PASSED:
             return 'ok'
-        elif build['outcome'] in {Outcome.CRASHED, Outcome.FAILED}:
+        if outcome in BROKEN_OUTCOMES:
             return 'error'
-        else:
-            continue
     return 'neutral'
 
 
@@ -184,18 +252,17 @@ def estimate_time(builds):
     if current.get('started_at') is None:
         current['elapsed'] = 'estimate not available'
         return
-    usable = [
-        current for current in builds[index + 1:]
-        if current['outcome'] == 'passed' and current['duration'] is not None
-    ]
-    if not usable:
+    total = count = 0
+    for build in islice(builds, index + 1, None):
+        if build['outcome'] == 'passed' and build['duration'] is not None:
+            total += build['duration']
+            count += 1
+    if not count:
         current['elapsed'] = 'estimate not available'
         return
-    average_duration = int(sum(build['duration'] for build in usable) /
-                           float(len(usable)))
+    average_duration = int(total / count)
     finish = current['started_at'] + average_duration
-    remaining = (datetime.fromtimestamp(finish) -
-                 datetime.now()).total_seconds()
+    remaining = finish - _now()
     if remaining >= 0:
         current['elapsed'] = '{} left'.format(naturaldelta(remaining))
     else:
@@ -233,6 +300,13 @@ TRACKER_STORY = re.compile(r'''
 """
 
 
+TAGS = re.compile(
+    '(?:{})|(?:{})'.format(GITHUB_ISSUE.pattern, TRACKER_STORY.pattern),
+    re.IGNORECASE + re.VERBOSE,
+)
+"""Pattern for any of the supported tag formats, to remove in one pass."""
+
+
 def remove_tags(commit_message):
     """Remove issue/tracker tags from a commit message.
 
@@ -247,9 +321,7 @@ def remove_tags(commit_message):
       :py:class:`str`: The message with tags removed.
 
     """
-    for remove in [GITHUB_ISSUE, TRACKER_STORY]:
-        commit_message = remove.sub('', commit_message)
-    return commit_message.strip()
+    return TAGS.sub('', commit_message).strip()
 
 
 def required_args(attrs):
@@ -264,18 +336,63 @@ def required_args(attrs):
     """
     init_args = attr_args = set()
     if '__init__' in attrs:
-        sig = Signature.from_callable(attrs['__init__'])
-        init_args = set(
-            name
-            for name, param in sig.parameters.items()
-            if param.kind == Parameter.KEYWORD_ONLY
-            and param.default is Signature.empty
-        )
+        init_args = _required_keywords(attrs['__init__'])
     if 'REQUIRED' in attrs:
         attr_args = attrs['REQUIRED']
     return set.union(attr_args, init_args)
 
 
+@lru_cache(maxsize=128)
+def _required_keywords(func):
+    """Extract the keyword-only arguments without defaults.
+
+    Note:
+      Every subclass re-inspects its bases' initialisers, so the
+      results are cached per function. The code object is read
+      directly, rather than building a full :py:class:`inspect.Signature`.
+
+    Arguments:
+      func: The function to inspect.
+
+    Returns:
+      :py:class:`frozenset`: The required keyword-only arguments.
+
+    """
+    code = func.__code__
+    keywords = code.co_varnames[
+        code.co_argcount:code.co_argcount + code.co_kwonlyargcount
+    ]
+    return frozenset(keywords).difference(func.__kwdefaults__ or ())
+
+
+def pooled_session(pool_connections=4, pool_maxsize=10):
+    """Create a session that keeps connections alive between requests.
+
+    Note:
+      The session is shared between services (and so between
+      accounts), so it doesn't store any cookies from the responses.
+
+    Arguments:
+      pool_connections (:py:class:`int`, optional): The number of hosts
+        to keep connection pools for (defaults to ``4``).
+      pool_maxsize (:py:class:`int`, optional): The maximum number of
+        connections to keep per host (defaults to ``10``).
+
+    Returns:
+      :py:class:`requests.Session`: The new session.
+
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 def provided_args(attrs):
     """Extract the provided arguments from a class's attrs.
 
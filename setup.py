@@ -65,6 +65,7 @@ setup(
     ],
     cmdclass={'test': PyTest},
     description=description,
+    extras_require={'speedups': ['orjson']},
     install_requires=['Flask', 'humanize', 'python-dateutil', 'requests'],
     license='License :: OSI Approved :: ISC License (ISCL)',
     long_description=long_description,
@@ -74,7 +75,6 @@ setup(
     platforms='any',
     tests_require=[
         'beautifulsoup4',
-        'freezegun',
         'pylint',
         'pytest',
         'pytest-pylint',
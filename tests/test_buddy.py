@@ -35,8 +35,7 @@ def test_correct_config():
 
 
 @mock.patch('flash_services.buddy.estimate_time')
-def test_update_success(mock_estimate, service, caplog, mocked_responses, buddy_json):
-    caplog.set_level(logging.DEBUG)
+def test_update_success(mock_estimate, service, mocked_responses, buddy_json, log_index):
     mocked_responses.add(
         responses.GET,
         'https://api.buddy.works/workspaces/bar/projects/baz/pipelines/123/executions',
@@ -46,11 +45,7 @@ def test_update_success(mock_estimate, service, caplog, mocked_responses, buddy_
     result = service.update()
 
     assert mocked_responses.calls[0].request.headers['Authorization'] == 'Bearer foo'
-    assert 'fetching Buddy project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.DEBUG
-    ]
+    assert 'fetching Buddy project data' in log_index()[logging.DEBUG]
     expected_builds = [
         dict(
             author='Mike Benson',
@@ -69,7 +64,7 @@ def test_update_success(mock_estimate, service, caplog, mocked_responses, buddy_
     }
 
 
-def test_update_failure(service, caplog, mocked_responses):
+def test_update_failure(service, log_index, mocked_responses):
     mocked_responses.add(
         responses.GET,
         'https://api.buddy.works/workspaces/bar/projects/baz/pipelines/123/executions',
@@ -78,11 +73,7 @@ def test_update_failure(service, caplog, mocked_responses):
 
     result = service.update()
 
-    assert 'failed to update Buddy project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.ERROR
-    ]
+    assert 'failed to update Buddy project data' in log_index()[logging.ERROR]
     assert result == {}
 
 
@@ -21,28 +21,23 @@ def test_service_type():
     assert issubclass(CircleCI, ContinuousIntegrationService)
 
 
-def test_update_success(service, caplog, mocked_responses):
-    caplog.set_level(logging.DEBUG)
+def test_update_success(service, mocked_responses, log_index):
     mocked_responses.add(
         responses.GET,
         'https://circleci.com/api/v1.1/project/foo/bar/baz/tree/qux?limit=100&shallow=true',
-        json=[]
+        body=b'[]',
+        content_type='application/json',
     )
 
     result = service.update()
 
-    assert 'fetching CircleCI project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.DEBUG
-    ]
+    assert 'fetching CircleCI project data' in log_index()[logging.DEBUG]
     assert result == {'builds': [], 'name': 'foo/bar/baz [qux]', 'health': 'neutral'}
     assert mocked_responses.calls[0].request.headers['Accept'] == 'application/json'
     assert mocked_responses.calls[0].request.headers['Circle-Token'] == 'banana'
 
 
-def test_passing_build(service, caplog, mocked_responses):
-    caplog.set_level(logging.DEBUG)
+def test_passing_build(service, mocked_responses, log_index):
     mocked_responses.add(
         responses.GET,
         'https://circleci.com/api/v1.1/project/foo/bar/baz/tree/qux?limit=100&shallow=true',
@@ -59,11 +54,7 @@ def test_passing_build(service, caplog, mocked_responses):
 
     result = service.update()
 
-    assert 'fetching CircleCI project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.DEBUG
-    ]
+    assert 'fetching CircleCI project data' in log_index()[logging.DEBUG]
     assert result == dict(
         builds=[
             dict(
@@ -80,7 +71,7 @@ def test_passing_build(service, caplog, mocked_responses):
     )
 
 
-def test_update_failure(service, caplog, mocked_responses):
+def test_update_failure(service, log_index, mocked_responses):
     mocked_responses.add(
         responses.GET,
         'https://circleci.com/api/v1.1/project/foo/bar/baz/tree/qux?limit=100&shallow=true',
@@ -89,11 +80,7 @@ def test_update_failure(service, caplog, mocked_responses):
 
     result = service.update()
 
-    assert 'failed to update CircleCI project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.ERROR
-    ]
+    assert 'failed to update CircleCI project data' in log_index()[logging.ERROR]
     assert result == {}
 
 
@@ -23,8 +23,7 @@ def test_correct_config():
     assert Codeship.TEMPLATE == 'ci-section'
 
 
-def test_update_success(service, caplog, mocked_responses):
-    caplog.set_level(logging.DEBUG)
+def test_update_success(service, mocked_responses, log_index):
     mocked_responses.add(
         responses.GET,
         'https://codeship.com/api/v1/projects/123.json?api_key=foobar',
@@ -33,15 +32,11 @@ def test_update_success(service, caplog, mocked_responses):
 
     result = service.update()
 
-    assert 'fetching Codeship CI project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.DEBUG
-    ]
+    assert 'fetching Codeship CI project data' in log_index()[logging.DEBUG]
     assert result == {'builds': [], 'name': 'bar', 'health': 'neutral'}
 
 
-def test_update_failure(service, caplog, mocked_responses):
+def test_update_failure(service, log_index, mocked_responses):
     mocked_responses.add(
         responses.GET,
         'https://codeship.com/api/v1/projects/123.json?api_key=foobar',
@@ -50,11 +45,7 @@ def test_update_failure(service, caplog, mocked_responses):
 
     result = service.update()
 
-    assert 'failed to update Codeship CI project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.ERROR
-    ]
+    assert 'failed to update Codeship CI project data' in log_index()[logging.ERROR]
     assert result == {}
 
 
@@ -90,7 +81,7 @@ def test_formatting(service, mocked_responses):
     )
 
 
-def test_unfinished_formatting(service, caplog, mocked_responses):
+def test_unfinished_formatting(service, log_index, mocked_responses):
     mocked_responses.add(
         responses.GET,
         'https://codeship.com/api/v1/projects/123.json?api_key=foobar',
@@ -120,8 +111,4 @@ def test_unfinished_formatting(service, caplog, mocked_responses):
         )],
         health='neutral',
     )
-    assert 'unknown outcome: garbage' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.WARN
-    ]
+    assert 'unknown outcome: garbage' in log_index()[logging.WARN]
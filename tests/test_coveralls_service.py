@@ -1,6 +1,4 @@
 import logging
-from datetime import datetime
-from datetime import timedelta
 
 import pytest
 import responses
@@ -40,12 +38,8 @@ def test_health(build, outcome, service, mocked_responses):
     assert result['health'] == outcome
 
 
-TWO_DAYS_AGO = (datetime.now() - timedelta(days=2, hours=12)).strftime(
-    '%Y-%m-%dT%H:%M:%SZ',
-)
-
-
-def test_update(service, mocked_responses):
+@pytest.mark.usefixtures('frozen_now')
+def test_update(service, mocked_responses, two_days_ago):
     mocked_responses.add(
         responses.GET,
         'https://coveralls.io/foo/bar/baz.json?page=1',
@@ -54,7 +48,7 @@ def test_update(service, mocked_responses):
                 commit_message='[#123456] some message',
                 committer_name='Dummy User',
                 covered_percent=80,
-                created_at=TWO_DAYS_AGO,
+                created_at=two_days_ago,
             )],
         )
     )
@@ -92,7 +86,7 @@ def test_format_build_missing_data(service, mocked_responses):
     )
 
 
-def test_update_failure(service, caplog, mocked_responses):
+def test_update_failure(service, log_index, mocked_responses):
     mocked_responses.add(
         responses.GET,
         'https://coveralls.io/foo/bar/baz.json?page=1',
@@ -101,9 +95,5 @@ def test_update_failure(service, caplog, mocked_responses):
 
     result = service.update()
 
-    assert 'failed to update Coveralls project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.ERROR
-    ]
+    assert 'failed to update Coveralls project data' in log_index()[logging.ERROR]
     assert result == {}
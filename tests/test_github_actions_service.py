@@ -18,8 +18,7 @@ def test_service_type():
     assert GitHubActions.TEMPLATE == 'ci-section'
 
 
-def test_update_success(service, caplog, mocked_responses):
-    caplog.set_level(logging.DEBUG)
+def test_update_success(service, mocked_responses, log_index):
     mocked_responses.add(
         responses.GET,
         'https://api.github.com/repos/foo/bar/actions/runs?per_page=100',
@@ -28,11 +27,7 @@ def test_update_success(service, caplog, mocked_responses):
 
     result = service.update()
 
-    assert 'fetching GitHub Actions project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.DEBUG
-    ]
+    assert 'fetching GitHub Actions project data' in log_index()[logging.DEBUG]
     assert result == {'builds': [], 'name': 'foo/bar', 'health': 'neutral'}
     headers = mocked_responses.calls[0].request.headers
     assert headers['Accept'] == 'application/vnd.github.v3+json'
@@ -40,7 +35,7 @@ def test_update_success(service, caplog, mocked_responses):
     assert headers['User-Agent'] == 'bar'
 
 
-def test_update_failure(service, caplog, mocked_responses):
+def test_update_failure(service, log_index, mocked_responses):
     mocked_responses.add(
         responses.GET,
         'https://api.github.com/repos/foo/bar/actions/runs?per_page=100',
@@ -49,74 +44,34 @@ def test_update_failure(service, caplog, mocked_responses):
 
     result = service.update()
 
-    assert 'failed to update GitHub Actions project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.ERROR
-    ]
+    assert 'failed to update GitHub Actions project data' in log_index()[logging.ERROR]
     assert result == {}
 
 
-def test_passing_build(service, mocked_responses):
-    mocked_responses.add(
-        responses.GET,
-        'https://api.github.com/repos/foo/bar/actions/runs?per_page=100',
-        json={
-            "workflow_runs": [
-                {
-                    "conclusion": "success",
-                    "created_at": "2016-04-14T20:47:40Z",
-                    "head_commit": {
-                        "message": "I did some work",
-                        "author": {
-                            "name": "Jane Doe"
-                        }
-                    },
-                    "status": "completed",
-                    "updated_at": "2016-04-14T20:57:07Z"
-                }
-            ]
-        }
-    )
-
-    result = service.update()
-
-    assert result == dict(
-        builds=[
-            dict(
-                author='Jane Doe',
-                duration=567,
-                elapsed='took nine minutes',
-                message='I did some work',
-                outcome='passed',
-                started_at=1460666860,
-            )
-        ],
-        name='foo/bar',
-        health='ok'
-    )
+def _run(conclusion, message):
+    return {
+        "conclusion": conclusion,
+        "created_at": "2016-04-14T20:47:40Z",
+        "head_commit": {
+            "message": message,
+            "author": {
+                "name": "Jane Doe"
+            }
+        },
+        "status": "completed",
+        "updated_at": "2016-04-14T20:57:07Z"
+    }
 
 
-def test_failing_build(service, mocked_responses):
+@pytest.mark.parametrize('conclusion, message, outcome, health', [
+    ('success', 'I did some work', 'passed', 'ok'),
+    ('failure', 'I did some bad work', 'failed', 'error'),
+])
+def test_completed_build(conclusion, message, outcome, health, service, mocked_responses):
     mocked_responses.add(
         responses.GET,
         'https://api.github.com/repos/foo/bar/actions/runs?per_page=100',
-        json={
-            "workflow_runs": [
-                {
-                    "conclusion": "failure",
-                    "created_at": "2016-04-14T20:47:40Z",
-                    "head_commit": {
-                        "message": "I did some bad work",
-                        "author": {
-                            "name": "Jane Doe"
-                        }
-                    },
-                    "status": "completed",
-                    "updated_at": "2016-04-14T20:57:07Z"
-                }
-            ]
-        }
+        json={"workflow_runs": [_run(conclusion, message)]},
     )
 
     result = service.update()
@@ -127,13 +82,13 @@ def test_failing_build(service, mocked_responses):
                 author='Jane Doe',
                 duration=567,
                 elapsed='took nine minutes',
-                message='I did some bad work',
-                outcome='failed',
+                message=message,
+                outcome=outcome,
                 started_at=1460666860,
             )
         ],
         name='foo/bar',
-        health='error'
+        health=health,
     )
 
 
@@ -171,18 +126,8 @@ def test_working_build(service, mocked_responses):
                     },
                     "status": "in_progress",
                     "updated_at": "2016-04-14T20:47:40Z"
-                }, {
-                    "conclusion": "success",
-                    "created_at": "2016-04-14T20:47:40Z",
-                    "head_commit": {
-                        "message": "I did some work",
-                        "author": {
-                            "name": "Jane Doe"
-                        }
-                    },
-                    "status": "completed",
-                    "updated_at": "2016-04-14T20:57:07Z"
-                }
+                },
+                _run("success", "I did some work"),
             ]
         },
     )
@@ -199,8 +144,7 @@ def test_working_build(service, mocked_responses):
     )
 
 
-def test_actions_enterprise_update(caplog, mocked_responses):
-    caplog.set_level(logging.DEBUG)
+def test_actions_enterprise_update(mocked_responses, log_index):
     mocked_responses.add(
         responses.GET,
         'http://dummy.url/repos/foo/bar/actions/runs?per_page=100',
@@ -216,11 +160,7 @@ def test_actions_enterprise_update(caplog, mocked_responses):
 
     result = service.update()
 
-    assert 'fetching GitHub Actions project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.DEBUG
-    ]
+    assert 'fetching GitHub Actions project data' in log_index()[logging.DEBUG]
     assert result == dict(builds=[], name='foo/bar', health='neutral')
     headers = mocked_responses.calls[0].request.headers
     assert headers['Accept'] == 'application/vnd.github.v3+json'
@@ -1,3 +1,4 @@
+import json
 import logging
 
 import pytest
@@ -30,118 +31,125 @@ def test_correct_enterprise_config():
     assert GitHubEnterpriseIssues.TEMPLATE == 'gh-issues-section'
 
 
-def test_update_success(service, caplog, mocked_responses):
-    caplog.set_level(logging.DEBUG)
-    mocked_responses.add(
-        responses.GET,
-        'https://api.github.com/repos/foo/bar/issues?state=all',
-        headers={'User-Agent': 'bar'},
-        json=[],
-    )
+def _graphql(issues=(), pull_requests=()):
+    return {'data': {'repository': {
+        'issues': {'nodes': list(issues)},
+        'pullRequests': {'nodes': list(pull_requests)},
+    }}}
+
+
+EMPTY_SUMMARY = dict(name='foo/bar', issues={}, health='neutral', halflife=None)
+
+
+@pytest.mark.parametrize('service_class, config, url', [
+    (GitHubIssues, {}, 'https://api.github.com/graphql'),
+    (GitHubEnterpriseIssues, {'root': 'http://dummy.url'}, 'http://dummy.url/graphql'),
+    (GitHubEnterpriseIssues, {'root': 'http://dummy.url/v3'}, 'http://dummy.url/graphql'),
+])
+def test_update_success(service_class, config, url, mocked_responses, log_index):
+    mocked_responses.add(responses.POST, url, json=_graphql())
+    service = service_class(username='user', password='foobar', account='foo', repo='bar', **config)
 
     result = service.update()
 
-    assert 'fetching GitHub Issues project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.DEBUG
-    ]
-    assert result == {'issues': {}, 'name': 'foo/bar', 'health': 'neutral', 'halflife': None}
+    assert 'fetching GitHub Issues project data' in log_index()[logging.DEBUG]
+    assert result == EMPTY_SUMMARY
+    request = mocked_responses.calls[0].request
+    assert request.headers['User-Agent'] == 'bar'
+    assert request.headers['Authorization'] == 'Basic dXNlcjpmb29iYXI='
+    assert json.loads(request.body)['variables'] == {'owner': 'foo', 'name': 'bar'}
+    assert request.req_kwargs['timeout'] == service_class.TIMEOUT
 
 
-def test_update_enterprise_success(caplog, mocked_responses):
-    caplog.set_level(logging.DEBUG)
+def test_update_failure(service, log_index, mocked_responses):
     mocked_responses.add(
-        responses.GET,
-        'http://dummy.url/repos/foo/bar/issues?state=all',
-        headers={'User-Agent': 'bar'},
-        json=[],
-    )
-    service = GitHubEnterpriseIssues(
-        username='enterprise-user',
-        password='foobar',
-        account='foo',
-        repo='bar',
-        root='http://dummy.url',
+        responses.POST,
+        'https://api.github.com/graphql',
+        status=401,
     )
 
     result = service.update()
 
-    assert 'fetching GitHub Issues project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.DEBUG
-    ]
-    assert result == {'issues': {}, 'name': 'foo/bar', 'health': 'neutral', 'halflife': None}
+    assert 'failed to update GitHub Issues project data' in log_index()[logging.ERROR]
+    assert result == {}
 
 
-def test_update_failure(service, caplog, mocked_responses):
+def test_update_query_errors(service, log_index, mocked_responses):
     mocked_responses.add(
-        responses.GET,
-        'https://api.github.com/repos/foo/bar/issues?state=all',
-        headers={'User-Agent': 'bar'},
-        status=401,
+        responses.POST,
+        'https://api.github.com/graphql',
+        json={'data': {'repository': None}, 'errors': [{'type': 'NOT_FOUND'}]},
     )
 
     result = service.update()
 
-    assert 'failed to update GitHub Issues project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.ERROR
-    ]
+    assert 'failed to update GitHub Issues project data' in log_index()[logging.ERROR]
     assert result == {}
 
 
 @pytest.mark.parametrize('payload, expected', [
-    ([], dict(name='foo/bar', issues={}, health='neutral', halflife=None)),
+    (_graphql(), EMPTY_SUMMARY),
     (
-        [{'state': 'open'}, {'state': 'open'}],
+        _graphql(issues=[{'state': 'OPEN'}, {'state': 'OPEN'}]),
         dict(name='foo/bar', issues={'open-issues': 2}, health='neutral',
              halflife=None),
     ),
     (
-        [{'state': 'open'}, {'state': 'closed'}],
+        _graphql(issues=[{'state': 'OPEN'}, {'state': 'CLOSED'}]),
         dict(name='foo/bar', issues={'open-issues': 1, 'closed-issues': 1},
              health='neutral', halflife=None),
     ),
     (
-        [{'state': 'open'}, {'state': 'open', 'pull_request': {}}],
+        _graphql(issues=[{'state': 'OPEN'}], pull_requests=[{'state': 'OPEN'}]),
         dict(name='foo/bar', issues={'open-issues': 1, 'open-pull-requests':
             1},
              health='neutral', halflife=None),
     ),
     (
-        [{'state': 'closed', 'created_at': '2010/11/12', 'closed_at': '2010/11/14'}],
+        _graphql(pull_requests=[{'state': 'MERGED'}, {'state': 'CLOSED'}]),
+        dict(name='foo/bar', issues={'closed-pull-requests': 2},
+             health='neutral', halflife=None),
+    ),
+    (
+        _graphql(issues=[{'state': 'CLOSED', 'createdAt': '2010-11-12T00:00:00Z', 'closedAt': '2010-11-14T00:00:00Z'}]),
         dict(name='foo/bar', issues={'closed-issues': 1}, health='ok',
              halflife='two days'),
     ),
     (
-        [{'state': 'closed', 'created_at': '2010/11/12', 'closed_at': '2010/11/22'}],
+        _graphql(issues=[{'state': 'CLOSED', 'createdAt': '2010-11-12T00:00:00Z', 'closedAt': '2010-11-22T00:00:00Z'}]),
         dict(name='foo/bar', issues={'closed-issues': 1}, health='neutral',
              halflife='ten days'),
     ),
     (
-        [{'state': 'closed', 'created_at': '2010/10/12', 'closed_at': '2010/11/14'}],
+        _graphql(issues=[{'state': 'CLOSED', 'createdAt': '2010-11-12T01:00:00+01:00', 'closedAt': '2010-11-14T00:00:00Z'}]),
+        dict(name='foo/bar', issues={'closed-issues': 1}, health='ok',
+             halflife='two days'),
+    ),
+    (
+        _graphql(issues=[{'state': 'CLOSED', 'createdAt': '2010-10-12T00:00:00Z', 'closedAt': '2010-11-14T00:00:00Z'}]),
         dict(name='foo/bar', issues={'closed-issues': 1}, health='error',
              halflife='a month'),
     ),
     (
-        [
-            {'state': 'closed', 'created_at': '2010/10/12', 'closed_at': '2010/10/15'},
-            {'state': 'closed', 'created_at': '2010/10/12', 'closed_at': '2010/10/16'},
-            {'state': 'open', 'created_at': '2010/10/12', 'closed_at': None},
-        ],
+        _graphql(issues=[
+            {'state': 'CLOSED', 'createdAt': '2010-10-12T00:00:00Z', 'closedAt': '2010-10-15T00:00:00Z'},
+            {'state': 'CLOSED', 'createdAt': '2010-10-12T00:00:00Z', 'closedAt': '2010-10-16T00:00:00Z'},
+            {'state': 'OPEN', 'createdAt': '2010-10-12T00:00:00Z', 'closedAt': None},
+        ]),
         dict(name='foo/bar', issues={'closed-issues': 2, 'open-issues': 1},
              health='ok', halflife='three days'),
     ),
     (
-        [
-            {'state': 'closed', 'created_at': '2010/10/12', 'closed_at': '2010/10/15'},
-            {'state': 'closed', 'created_at': '2010/10/12', 'closed_at': '2010/10/16', 'pull_request': {}},
-            {'state': 'closed', 'created_at': '2010/10/12', 'closed_at': '2010/10/17'},
-            {'state': 'open', 'created_at': '2010/10/12', 'closed_at': None},
-        ],
+        _graphql(
+            issues=[
+                {'state': 'CLOSED', 'createdAt': '2010-10-12T00:00:00Z', 'closedAt': '2010-10-15T00:00:00Z'},
+                {'state': 'CLOSED', 'createdAt': '2010-10-12T00:00:00Z', 'closedAt': '2010-10-17T00:00:00Z'},
+                {'state': 'OPEN', 'createdAt': '2010-10-12T00:00:00Z', 'closedAt': None},
+            ],
+            pull_requests=[
+                {'state': 'MERGED', 'createdAt': '2010-10-12T00:00:00Z', 'closedAt': '2010-10-16T00:00:00Z'},
+            ],
+        ),
         dict(
             name='foo/bar',
             issues={'closed-issues': 2, 'closed-pull-requests': 1, 'open-issues': 1},
@@ -150,24 +158,57 @@ def test_update_failure(service, caplog, mocked_responses):
         ),
     ),
 ])
-def test_format_data(payload, expected, service, mocked_responses):
-    mocked_responses.add(
-        responses.GET,
-        'https://api.github.com/repos/foo/bar/issues?state=all',
-        json=payload,
-    )
-
-    assert service.update() == expected
-    assert mocked_responses.calls[0].request.headers['User-Agent'] == 'bar'
+def test_format_data(payload, expected, service):
+    assert service.format_data(payload) == expected
 
 
 def test_adjust_threshold():
     service = GitHubIssues(ok_threshold=1, account='', repo='', username='', password='')
     assert service.ok_threshold == 1
     assert service.neutral_threshold == 30
-    issues = [
-        {'state': 'closed', 'created_at': '2010/10/12', 'closed_at': '2010/10/15'},
-    ]
+    issues = _graphql(issues=[
+        {'state': 'CLOSED', 'createdAt': '2010-10-12T00:00:00Z', 'closedAt': '2010-10-15T00:00:00Z'},
+    ])
     assert service.format_data(issues).get('health') == 'neutral'
     service.neutral_threshold = 2
     assert service.format_data(issues).get('health') == 'error'
+
+
+def test_update_reuses_formatted_data(service, mocked_responses, monkeypatch):
+    mocked_responses.add(
+        responses.POST,
+        'https://api.github.com/graphql',
+        json=_graphql(issues=[
+            {'state': 'CLOSED', 'createdAt': '2010-10-12T00:00:00Z', 'closedAt': '2010-10-15T00:00:00Z'},
+        ]),
+    )
+    formatted = []
+    format_data = service.format_data
+    monkeypatch.setattr(service, 'format_data', lambda data: formatted.append(data) or format_data(data))
+
+    first = service.update()
+    second = service.update()
+    service.ok_threshold = 1
+    third = service.update()
+
+    assert len(formatted) == 2
+    assert first == second
+    assert first['health'] == 'ok'
+    assert third['health'] == 'neutral'
+
+
+def test_update_keeps_recently_used_data(service, mocked_responses, monkeypatch):
+    payloads = {
+        name: _graphql(issues=[{'state': 'OPEN'}] * count)
+        for name, count in [('a', 1), ('b', 2), ('c', 3)]
+    }
+    for name in ['a', 'b', 'a', 'c', 'a']:
+        mocked_responses.add(responses.POST, 'https://api.github.com/graphql', json=payloads[name])
+    formatted = []
+    format_data = service.format_data
+    monkeypatch.setattr(service, 'format_data', lambda data: formatted.append(data) or format_data(data))
+
+    results = [service.update() for _ in range(5)]
+
+    assert formatted == [payloads['a'], payloads['b'], payloads['c']]
+    assert results[4] == results[2] == results[0]
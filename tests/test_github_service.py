@@ -1,19 +1,27 @@
 import logging
-from datetime import datetime, timedelta
+import re
 
 import pytest
 import responses
 
 from flash_services.core import Service
-from flash_services.github import GitHub, GitHubEnterprise
+from flash_services.github import GitHub, GitHubEnterprise, GitHubIssues
 
 
-@pytest.fixture
+COMMITS = re.compile(r'https?://[^/]+/repos/foo/bar/commits')
+
+
+@pytest.fixture(autouse=True)
+def commits(mocked_responses):
+    mocked_responses.add(responses.GET, COMMITS, body=b'[]', content_type='application/json')
+
+
+@pytest.fixture(scope='module')
 def service():
     return GitHub(username='janedoe', password='foobar', account='foo', repo='bar')
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def branched():
     return GitHub(username='janedoe', password='foobar', account='foo', repo='bar', branch='baz')
 
@@ -29,6 +37,10 @@ def test_correct_config():
     assert GitHub.TEMPLATE == 'vcs-section'
 
 
+def test_session_shared(service, branched):
+    assert service.session is branched.session is GitHubIssues.session
+
+
 def test_correct_enterprise_config():
     assert GitHubEnterprise.FRIENDLY_NAME == 'GitHub'
     assert GitHubEnterprise.REQUIRED == {'username', 'password', 'account', 'repo', 'root'}
@@ -36,85 +48,45 @@ def test_correct_enterprise_config():
     assert GitHubEnterprise.TEMPLATE == 'vcs-section'
 
 
-TWO_DAYS_AGO = (datetime.now() - timedelta(days=2, hours=12)).strftime(
-    '%Y-%m-%dT%H:%M:%SZ',
-)
-
-
-def test_update_success(service, caplog, mocked_responses):
-    caplog.set_level(logging.DEBUG)
-    mocked_responses.add(
-        responses.GET,
-        'https://api.github.com/repos/foo/bar/commits',
-        json=[{'commit': {
-            'author': {'name': 'alice'},
-            'committer': {'name': 'bob', 'date': TWO_DAYS_AGO},
-            'message': 'commit message',
-        }}],
-    )
-
-    result = service.update()
-
-    assert 'fetching GitHub project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.DEBUG
-    ]
-    assert result == {'commits': [{
-        'message': 'commit message',
-        'author': 'alice [bob]',
-        'committed': 'two days ago'
-    }], 'name': 'foo/bar'}
-    headers = mocked_responses.calls[0].request.headers
-    assert headers['User-Agent'] == 'bar'
-    assert headers['Authorization'] == 'Basic amFuZWRvZTpmb29iYXI='
-
-
-def test_update_enterprise_success(caplog, mocked_responses):
-    caplog.set_level(logging.DEBUG)
-    mocked_responses.add(
+@pytest.mark.parametrize('service_class, config, url', [
+    (GitHub, {}, 'https://api.github.com/repos/foo/bar/commits'),
+    (GitHubEnterprise, {'root': 'http://dummy.url'}, 'http://dummy.url/repos/foo/bar/commits'),
+])
+@pytest.mark.usefixtures('frozen_now')
+def test_update_success(service_class, config, url, log_index, mocked_responses, two_days_ago):
+    mocked_responses.replace(
         responses.GET,
-        'http://dummy.url/repos/foo/bar/commits',
+        COMMITS,
         json=[{'commit': {
             'author': {'name': 'alice'},
-            'committer': {'name': 'bob', 'date': TWO_DAYS_AGO},
+            'committer': {'name': 'bob', 'date': two_days_ago},
             'message': 'commit message',
         }}],
     )
-
-    service = GitHubEnterprise(username='johndoe', password='foobar',
-                               account='foo', repo='bar',
-                               root='http://dummy.url')
+    service = service_class(username='janedoe', password='foobar', account='foo', repo='bar',
+                            **config)
 
     result = service.update()
 
-    assert 'fetching GitHub project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.DEBUG
-    ]
+    assert 'fetching GitHub project data' in log_index()[logging.DEBUG]
     assert result == {'commits': [{
         'message': 'commit message',
         'author': 'alice [bob]',
         'committed': 'two days ago'
     }], 'name': 'foo/bar'}
-    assert mocked_responses.calls[0].request.headers['User-Agent'] == 'bar'
+    request = mocked_responses.calls[0].request
+    assert request.url == url
+    assert request.headers['User-Agent'] == 'bar'
+    assert request.headers['Authorization'] == 'Basic amFuZWRvZTpmb29iYXI='
+    assert request.req_kwargs['timeout'] == service_class.TIMEOUT
 
 
-def test_update_failure(service, caplog, mocked_responses):
-    mocked_responses.add(
-        responses.GET,
-        'https://api.github.com/repos/foo/bar/commits',
-        status=401,
-    )
+def test_update_failure(service, log_index, mocked_responses):
+    mocked_responses.replace(responses.GET, COMMITS, status=401)
 
     result = service.update()
 
-    assert 'failed to update GitHub project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.ERROR
-    ]
+    assert 'failed to update GitHub project data' in log_index()[logging.ERROR]
     assert result == {}
     assert mocked_responses.calls[0].request.headers['User-Agent'] == 'bar'
 
@@ -150,26 +122,35 @@ def test_update_failure(service, caplog, mocked_responses):
         ),
     ),
 ])
-def test_format_commit(service, commit, expected, mocked_responses):
-    mocked_responses.add(
-        responses.GET,
-        'https://api.github.com/repos/foo/bar/commits',
-        json=[dict(commit=commit)],
-    )
+def test_format_commit(commit, expected):
+    assert GitHub.format_commit(commit) == expected
 
-    result = service.update()
 
-    assert result['commits'][0] == expected
-    assert mocked_responses.calls[0].request.headers['User-Agent'] == 'bar'
+def test_branch_url(branched, mocked_responses):
+    branched.update()
 
+    request = mocked_responses.calls[0].request
+    assert request.url == 'https://api.github.com/repos/foo/bar/commits?sha=baz'
+    assert request.headers['User-Agent'] == 'bar'
 
-def test_branch_url(branched, mocked_responses):
-    mocked_responses.add(
+
+def test_update_not_modified(mocked_responses):
+    service = GitHub(username='janedoe', password='foobar', account='foo', repo='bar')
+    mocked_responses.replace(
         responses.GET,
-        'https://api.github.com/repos/foo/bar/commits?sha=baz',
-        status=302,
+        COMMITS,
+        headers={'ETag': '"abc123"'},
+        json=[{'commit': {'author': {'name': 'alice'}, 'message': 'commit message'}}],
     )
+    mocked_responses.add(responses.GET, COMMITS, status=304)
 
-    branched.update()
+    first = service.update()
+    second = service.update()
 
-    assert mocked_responses.calls[0].request.headers['User-Agent'] == 'bar'
+    assert second == first == {'commits': [{
+        'message': 'commit message',
+        'author': 'alice',
+        'committed': 'time not available',
+    }], 'name': 'foo/bar'}
+    assert 'If-None-Match' not in mocked_responses.calls[0].request.headers
+    assert mocked_responses.calls[1].request.headers['If-None-Match'] == '"abc123"'
@@ -1,18 +1,17 @@
 import logging
-from datetime import datetime
 from urllib.parse import quote_plus
 
 import pytest
 import responses
-from freezegun import freeze_time
 
 from flash_services import Jenkins, SERVICES
 
 ROOT = 'https://test.org'
 JOB = 'baz'
+TREE = quote_plus(Jenkins.TREE_PARAMS)
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def service():
     return SERVICES['jenkins'](
         username='foo',
@@ -22,13 +21,17 @@ def service():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def url():
-    return '{}/job/{}/api/json?tree={}'.format(
-        ROOT,
-        JOB,
-        quote_plus(Jenkins.TREE_PARAMS),
-    )
+    return '{}/job/{}/api/json?tree={}'.format(ROOT, JOB, TREE)
+
+
+@pytest.fixture
+def mock_jenkins(mocked_responses, url):
+    def _mock(builds=(), name=JOB, **kwargs):
+        kwargs.setdefault('json', {'builds': list(builds), 'name': name})
+        mocked_responses.add(responses.GET, url, **kwargs)
+    return _mock
 
 
 def test_correct_config():
@@ -36,41 +39,34 @@ def test_correct_config():
     assert Jenkins.TEMPLATE == 'ci-section'
 
 
-def test_update_success(service, url, caplog, mocked_responses):
-    caplog.set_level(logging.DEBUG)
-    mocked_responses.add(
-        responses.GET,
-        url,
-        headers={'Authorization': 'Basic Zm9vOmJhcg=='},
-        json={'builds': [], 'name': 'baz'},
-    )
+def test_url_cached(service, url):
+    assert service.url == url
+    assert service.url is service.url
+
+
+def test_update_success(service, mock_jenkins, mocked_responses, log_index):
+    mock_jenkins()
 
     result = service.update()
 
-    assert 'fetching Jenkins project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.DEBUG
-    ]
+    assert 'fetching Jenkins project data' in log_index()[logging.DEBUG]
     assert result == {'builds': [], 'name': 'baz', 'health': 'neutral'}
+    assert mocked_responses.calls[0].request.headers['Authorization'] == 'Basic Zm9vOmJhcg=='
+    assert mocked_responses.calls[0].request.req_kwargs['timeout'] == Jenkins.TIMEOUT
 
 
-def test_update_failure(service, url, caplog, mocked_responses):
-    mocked_responses.add(responses.GET, url, status=401)
+def test_update_failure(service, log_index, mock_jenkins):
+    mock_jenkins(status=401, json=None)
 
     result = service.update()
 
-    assert 'failed to update Jenkins project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.ERROR
-    ]
+    assert 'failed to update Jenkins project data' in log_index()[logging.ERROR]
     assert result == {}
 
 
-def test_formatting(service, url, mocked_responses):
-    response = dict(name='job', builds=[
-        dict(
+@pytest.mark.parametrize('builds, frozen_now, expected, health', [
+    (
+        [dict(
             duration=31698,
             description=None,
             timestamp=1481387964313,
@@ -80,59 +76,38 @@ def test_formatting(service, url, mocked_responses):
                 dict(items=[dict(comment='world', author=dict(fullName='bar'))]),
                 dict(items=[dict(comment='again', author=dict(fullName='baz'))]),
             ]
-        )
-    ])
-    mocked_responses.add(responses.GET, url, json=response)
-
-    result = service.update()
-
-    assert result == dict(
-        name='job',
-        builds=[dict(
+        )],
+        1481387969,
+        dict(
             author='baz',
             duration=31,
             elapsed='took 31 seconds',
             message='again',
             outcome='passed',
             started_at=1481387964,
-        )],
-        health='ok',
-    )
-
-
-def test_aborted_formatting(service, url, mocked_responses):
-    response = dict(
-        name='job',
-        builds=[dict(
+        ),
+        'ok',
+    ),
+    (
+        [dict(
             duration=1234,
             description=None,
             timestamp=1481387964313,
             result='ABORTED',
         )],
-    )
-    mocked_responses.add(responses.GET, url, json=response)
-
-    result = service.update()
-
-    assert result == dict(
-        name='job',
-        builds=[dict(
+        1481387969,
+        dict(
             author='<no author>',
             duration=1,
             elapsed='took a second',
             message='<no message>',
             outcome='cancelled',
             started_at=1481387964,
-        )],
-        health='neutral',
-    )
-
-
-@freeze_time(datetime.fromtimestamp(1481387969.3))
-def test_unfinished_formatting(service, url, mocked_responses):
-    response = dict(
-        name='foo',
-        builds=[dict(
+        ),
+        'neutral',
+    ),
+    (
+        [dict(
             building=True,
             duration=0,
             description=None,
@@ -140,45 +115,42 @@ def test_unfinished_formatting(service, url, mocked_responses):
             result='SUCCESS',
             changeSets=[],
         )],
-    )
-    mocked_responses.add(responses.GET, url, json=response)
-
-    result = service.update()
-
-    assert result == dict(
-        name='foo',
-        builds=[dict(
+        1481387969.3,
+        dict(
             author='<no author>',
             duration=5,
             elapsed='estimate not available',
             message='<no message>',
             outcome='working',
             started_at=1481387964,
-        )],
-        health='neutral',
-    )
-
-
-@freeze_time(datetime.fromtimestamp(1481387969))
-def test_estimated_formatting(service, url, mocked_responses):
-    response = dict(name='foo', builds=[
-        dict(duration=0, description=None, timestamp=1481387964313, result=None),
-        dict(duration=10000, description=None, timestamp=1481387964313, result='SUCCESS'),
-        dict(duration=10000, description=None, timestamp=1481387964313, result='SUCCESS'),
-        dict(duration=10000, description=None, timestamp=1481387964313, result='SUCCESS'),
-        dict(duration=10000, description=None, timestamp=1481387964313, result='SUCCESS'),
-        dict(duration=10000, description=None, timestamp=1481387964313, result='SUCCESS'),
-    ])
-    mocked_responses.add(responses.GET, url, json=response)
-
-    result = service.update()
-
-    assert len(result['builds']) == 4
-    assert result['builds'][0] == dict(
-        author='<no author>',
-        duration=5,
-        elapsed='five seconds left',
-        message='<no message>',
-        outcome='working',
-        started_at=1481387964,
-    )
+        ),
+        'neutral',
+    ),
+    (
+        [
+            dict(duration=0, description=None, timestamp=1481387964313, result=None),
+            dict(duration=10000, description=None, timestamp=1481387964313, result='SUCCESS'),
+            dict(duration=10000, description=None, timestamp=1481387964313, result='SUCCESS'),
+            dict(duration=10000, description=None, timestamp=1481387964313, result='SUCCESS'),
+            dict(duration=10000, description=None, timestamp=1481387964313, result='SUCCESS'),
+            dict(duration=10000, description=None, timestamp=1481387964313, result='SUCCESS'),
+        ],
+        1481387969,
+        dict(
+            author='<no author>',
+            duration=5,
+            elapsed='five seconds left',
+            message='<no message>',
+            outcome='working',
+            started_at=1481387964,
+        ),
+        'ok',
+    ),
+], indirect=['frozen_now'])
+def test_formatting(builds, frozen_now, expected, health):
+    result = Jenkins.format_data(dict(name='job', builds=builds))
+
+    assert result['name'] == 'job'
+    assert len(result['builds']) == min(len(builds), 4)
+    assert result['builds'][0] == expected
+    assert result['health'] == health
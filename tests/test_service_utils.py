@@ -3,9 +3,10 @@ from datetime import datetime, timedelta
 
 import pytest
 
-from flash_services.utils import (elapsed_time, estimate_time, friendlier,
-                                  health_summary, occurred, required_args,
-                                  remove_tags)
+from flash_services.utils import (_elapsed_time, _parse_iso, _required_keywords,
+                                  elapsed_time, estimate_time, friendlier,
+                                  health_summary, occurred, pooled_session,
+                                  required_args, remove_tags)
 
 TWO_DAYS_AGO = datetime.now() - timedelta(days=2, hours=12)
 
@@ -15,18 +16,34 @@ TWO_DAYS_AGO = datetime.now() - timedelta(days=2, hours=12)
     ((TWO_DAYS_AGO.strftime('%Y-%m-%dT%H:%M:%SZ'),), 'two days ago', False),
     ((TWO_DAYS_AGO.strftime('%Y-%m-%dT%H:%M:%S'),), 'two days ago', False),
 ])
-def test_occurred(input_, expected, logged, caplog):
+def test_occurred(input_, expected, logged, caplog, log_index):
     assert occurred(*input_) == expected
     if logged:
-        assert 'failed to parse occurrence time None' in [
-            record.getMessage()
-            for record in caplog.records
-            if record.levelno == logging.WARN
-        ]
+        assert 'failed to parse occurrence time None' in log_index()[logging.WARN]
     else:
         assert caplog.records == []
 
 
+def test_parse_cached():
+    _parse_iso.cache_clear()
+
+    first = occurred('2011-12-11T02:15:16')
+    second = occurred('2011-12-11T02:15:16')
+
+    assert first == second
+    assert _parse_iso.cache_info().hits == 1
+
+
+def test_elapsed_time_cached():
+    _elapsed_time.cache_clear()
+
+    first = elapsed_time('2011-12-11T02:15:16', '2011-12-13T14:15:16')
+    second = elapsed_time('2011-12-11T02:15:16', '2011-12-13T14:15:16')
+
+    assert first == second
+    assert _elapsed_time.cache_info().hits == 1
+
+
 @pytest.mark.parametrize('input_, expected, logged', [
     ((None, None), (None, None, 'elapsed time not available'), True),
     (
@@ -44,15 +61,16 @@ def test_occurred(input_, expected, logged, caplog):
         (1323569716, 1323785716, 'took two days'),
         False,
     ),
+    (
+        ('2011-12-11T02:15:16Z', 'Tue, 13 Dec 2011 14:15:16 GMT'),
+        (1323569716, 1323785716, 'took two days'),
+        False,
+    ),
 ])
-def test_elapsed_time(input_, expected, logged, caplog):
+def test_elapsed_time(input_, expected, logged, caplog, log_index):
     assert elapsed_time(*input_) == expected
     if logged:
-        assert 'failed to generate elapsed time' in [
-            record.getMessage()
-            for record in caplog.records
-            if record.levelno == logging.WARN
-        ]
+        assert 'failed to generate elapsed time' in log_index()[logging.WARN]
     else:
         assert caplog.records == []
 
@@ -139,6 +157,7 @@ def test_build_estimate_not_first():
     ('[#123456789 fixed #234567] hello world', 'hello world'),
     ('[FINISHES #123456789] hello world', 'hello world'),
     ('hello world Fixes foo/bar#123', 'hello world'),
+    ('[fixes #123] hello world', 'hello world'),
 ])
 def test_remove_tags(message, expected):
     assert remove_tags(message) == expected
@@ -153,3 +172,23 @@ def test_remove_tags(message, expected):
 ])
 def test_required_args(attrs, expected):
     assert required_args(attrs) == expected
+
+
+def test_required_args_cached():
+    def init(self, *, foo):
+        pass
+    _required_keywords.cache_clear()
+
+    required_args({'__init__': init})
+    required_args({'__init__': init, 'REQUIRED': {'bar'}})
+
+    assert _required_keywords.cache_info().hits == 1
+
+
+def test_pooled_session():
+    session = pooled_session(pool_connections=2, pool_maxsize=5)
+
+    for prefix in ['http://', 'https://']:
+        adapter = session.get_adapter(prefix + 'example.com')
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 5
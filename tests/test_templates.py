@@ -22,12 +22,11 @@ def test_coveralls_section_with_builds(jinja):
     soup = _render(jinja, 'partials/coveralls-section.html', context)
 
     assert 'coveralls-pane' in soup.find('section', class_='pane')['class']
-    items = soup.find_all('div', class_='pane-item')
-    _assert_contains(items, 'author', ['Alice', 'Bob', 'Chris', 'Dipak'])
-    _assert_contains(items, 'coverage', ['10%', '20%', '30%', '40%'])
-    _assert_contains(items, 'message_text', ['one', 'two', 'three', 'four'])
+    _assert_contains(soup, 'author', ['Alice', 'Bob', 'Chris', 'Dipak'])
+    _assert_contains(soup, 'coverage', ['10%', '20%', '30%', '40%'])
+    _assert_contains(soup, 'message_text', ['one', 'two', 'three', 'four'])
     _assert_contains(
-        items,
+        soup,
         'committed',
         [
             'one minute ago',
@@ -52,10 +51,9 @@ def test_issues_section_with_halflife(jinja):
     soup = _render(jinja, 'partials/gh-issues-section.html', context)
 
     assert 'gh_issues-pane' in soup.find('section', class_='pane')['class']
-    items = soup.find_all('div', class_='pane-item')
-    _assert_contains(items, 'count', ['1', '2', '3', '4', 'one day'])
+    _assert_contains(soup, 'count', ['1', '2', '3', '4', 'one day'])
     _assert_classes_contain(
-        [item.find(class_='count') for item in items],
+        soup.select('.pane-item .count'),
         [
             'open-issues',
             'closed-issues',
@@ -79,8 +77,7 @@ def test_issues_section_without_halflife(jinja):
     soup = _render(jinja, 'partials/gh-issues-section.html', context)
 
     assert 'gh_issues-pane' in soup.find('section', class_='pane')['class']
-    items = soup.find_all('div', class_='pane-item')
-    _assert_contains(items, 'count', ['1', '2', '3', '4', 'N/A'])
+    _assert_contains(soup, 'count', ['1', '2', '3', '4', 'N/A'])
 
 
 def test_tracker_section(jinja):
@@ -92,15 +89,14 @@ def test_tracker_section(jinja):
     soup = _render(jinja, 'partials/tracker-section.html', context)
 
     assert 'tracker-pane' in soup.find('section', class_='pane')['class']
-    items = soup.find_all('div', class_='pane-item')
-    _assert_contains(items, 'count', ['7', '10', '2', '3', '0'])
+    _assert_contains(soup, 'count', ['7', '10', '2', '3', '0'])
     _assert_contains(
-        items,
+        soup,
         'item-title',
         ['Velocity: ', 'Ready: ', 'In flight: ', 'Completed: ', 'Accepted: '],
     )
     _assert_classes_contain(
-        [item.find(class_='count') for item in items],
+        soup.select('.pane-item .count'),
         ['velocity', 'ready', 'in-flight', 'completed', 'accepted'],
     )
 
@@ -114,12 +110,12 @@ def test_tracker_section_missing_categories(jinja):
     soup = _render(jinja, 'partials/tracker-section.html', context)
 
     assert 'tracker-pane' in soup.find('section', class_='pane')['class']
-    items = soup.find_all('div', class_='pane-item')
-    _assert_contains(items, 'count', ['7', '10', '0', '3', '0'])
+    _assert_contains(soup, 'count', ['7', '10', '0', '3', '0'])
 
 
-def _assert_contains(items, cls, expected):
-    assert [element.find(class_=cls).string for element in items] == expected
+def _assert_contains(soup, cls, expected):
+    selected = soup.select('.pane-item .{}'.format(cls))
+    assert [element.string for element in selected] == expected
 
 
 def _assert_classes_contain(items, classes):
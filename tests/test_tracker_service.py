@@ -2,16 +2,33 @@ import logging
 
 import pytest
 import responses
+from responses.matchers import query_string_matcher
 
 from flash_services.core import Service
-from flash_services.tracker import Tracker
+from flash_services.tracker import SESSION, Tracker
 
+PROJECT_URL = 'https://www.pivotaltracker.com/services/v5/projects/123'
 
-@pytest.fixture
-def service():
+ITERATION_FIELDS = query_string_matcher('fields=:default,velocity,stories')
+
+
+def _iteration_url(number):
+    return '{}/iterations/{}'.format(PROJECT_URL, number)
+
+
+@pytest.fixture(scope='module')
+def tracker():
     return Tracker(api_token='foobar', project_id=123)
 
 
+@pytest.fixture
+def service(tracker):
+    state = dict(vars(tracker))
+    yield tracker
+    vars(tracker).clear()
+    vars(tracker).update(state)
+
+
 def test_tracker_service_type():
     assert issubclass(Tracker, Service)
 
@@ -22,6 +39,10 @@ def test_correct_config():
     assert Tracker.ROOT == 'https://www.pivotaltracker.com/services/v5'
 
 
+def test_session_shared(service):
+    assert service.session is Tracker(api_token='bazqux', project_id=456).session is SESSION
+
+
 def test_headers(service):
     assert service.headers == {'X-TrackerToken': 'foobar'}
 
@@ -29,8 +50,8 @@ def test_headers(service):
 def test_get_velocity_success(service, mocked_responses):
     mocked_responses.add(
         responses.GET,
-        'https://www.pivotaltracker.com/services/v5/projects/123/iterations'
-        '/456?fields=%3Adefault%2Cvelocity%2Cstories',
+        _iteration_url(456),
+        match=[ITERATION_FIELDS],
         json={
             'velocity': 10,
             'stories': [
@@ -46,127 +67,205 @@ def test_get_velocity_success(service, mocked_responses):
     assert mocked_responses.calls[0].request.headers['X-TrackerToken'] == 'foobar'
 
 
-def test_update_success(service, caplog, mocked_responses):
-    caplog.set_level(logging.DEBUG)
+def test_update_success(service, mocked_responses, log_index):
     service.current_iteration = 1
     service.project_version = 2
     service._cached = {'foo': 'bar'}
     mocked_responses.add(
         responses.GET,
-        'https://www.pivotaltracker.com/services/v5/projects/123',
+        PROJECT_URL,
         json={'foo': 'bar', 'current_iteration_number': 0},
         adding_headers={'X-Tracker-Project-Version': '1'},
     )
 
     result = service.update()
 
-    assert 'fetching Tracker project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.DEBUG
-    ]
+    assert 'fetching Tracker project data' in log_index()[logging.DEBUG]
     assert result == {'foo': 'bar'}
     assert mocked_responses.calls[0].request.headers['X-TrackerToken'] == 'foobar'
 
 
-def test_get_velocity_failure(service, caplog, mocked_responses):
+def test_get_velocity_failure(service, log_index, mocked_responses):
     mocked_responses.add(
         responses.GET,
-        'https://www.pivotaltracker.com/services/v5/projects/123/iterations'
-        '/456?fields=%3Adefault%2Cvelocity%2Cstories',
+        _iteration_url(456),
+        match=[ITERATION_FIELDS],
         status=401,
     )
 
     result = service.details(456)
 
-    assert 'failed to update project iteration details' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.ERROR
-    ]
+    assert 'failed to update project iteration details' in log_index()[logging.ERROR]
     assert result == {}
     assert mocked_responses.calls[0].request.headers['X-TrackerToken'] == 'foobar'
 
 
-def test_update_failure(service, caplog, mocked_responses):
+def test_update_failure(service, log_index, mocked_responses):
     mocked_responses.add(
         responses.GET,
-        'https://www.pivotaltracker.com/services/v5/projects/123',
+        PROJECT_URL,
         status=401,
     )
 
     result = service.update()
 
-    assert 'failed to update Tracker project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.ERROR
-    ]
+    assert 'failed to update Tracker project data' in log_index()[logging.ERROR]
     assert result == {}
     assert mocked_responses.calls[0].request.headers['X-TrackerToken'] == 'foobar'
 
 
-def test_update_details(service, caplog, mocked_responses):
-    caplog.set_level(logging.DEBUG)
+def test_update_details(service, mocked_responses, log_index):
     service.current_iteration = 1
     service.project_version = 1
     service._cached = {'foo': 'bar'}
     name = 'foo'
     mocked_responses.add(
         responses.GET,
-        'https://www.pivotaltracker.com/services/v5/projects/123',
+        PROJECT_URL,
         json={'current_iteration_number': 1, 'name': name},
         adding_headers={'X-Tracker-Project-Version': '2'},
     )
     mocked_responses.add(
         responses.GET,
-        'https://www.pivotaltracker.com/services/v5/projects/123/iterations'
-        '/1?fields=%3Adefault%2Cvelocity%2Cstories',
+        _iteration_url(1),
+        match=[ITERATION_FIELDS],
         json={'velocity': 10, 'stories': []}
     )
 
     result = service.update()
 
-    debug_logs = [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.DEBUG
-    ]
+    debug_logs = log_index()[logging.DEBUG]
     assert 'fetching Tracker project data' in debug_logs
     assert 'project updated, fetching iteration details' in debug_logs
     assert result == dict(velocity=10, stories={}, name=name)
+    for call in mocked_responses.calls:
+        assert call.request.req_kwargs['timeout'] == Tracker.TIMEOUT
 
 
-@pytest.mark.parametrize('version, iteration, get_details', [
-    (1, 1, False),
-    (1, 2, True),
-    (2, 1, True),
-    (2, 2, True),
-])
-def test_update_cache(service, version, iteration, get_details, mocked_responses):
+def test_update_cache(service, mocked_responses):
     name = 'foo'
-    mocked_responses.add(
-        responses.GET,
-        'https://www.pivotaltracker.com/services/v5/projects/123',
-        adding_headers={'X-Tracker-Project-Version': str(version)},
-        json={'current_iteration_number': iteration, 'name': name},
-    )
-    if get_details:
+    mocked_responses.add(responses.GET, PROJECT_URL)
+    for iteration in [1, 2]:
         mocked_responses.add(
             responses.GET,
-            'https://www.pivotaltracker.com/services/v5/projects/123/iterations'
-            '/{}?fields=%3Adefault%2Cvelocity%2Cstories'.format(iteration),
-            json={},
+            _iteration_url(iteration),
+            match=[ITERATION_FIELDS],
+            body=b'{}',
+            content_type='application/json',
         )
-    service._cached = {}
-    service.current_iteration = 1
-    service.project_version = 1
 
-    result = service.update()
+    for version, iteration, get_details in [
+        (1, 1, False),
+        (1, 2, True),
+        (2, 1, True),
+        (2, 2, True),
+    ]:
+        mocked_responses.replace(
+            responses.GET,
+            PROJECT_URL,
+            headers={'X-Tracker-Project-Version': str(version)},
+            json={'current_iteration_number': iteration, 'name': name},
+        )
+        mocked_responses.calls.reset()
+        service._cached = {}
+        service.current_iteration = 1
+        service.project_version = 1
+
+        result = service.update()
+
+        if get_details:
+            assert len(mocked_responses.calls) == 2
+            assert result == dict(name=name, velocity='unknown', stories={})
+        else:
+            assert len(mocked_responses.calls) == 1
+            assert result is service._cached
+
+
+def test_update_not_modified(service, mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        PROJECT_URL,
+        adding_headers={'ETag': '"abc123"', 'X-Tracker-Project-Version': '1'},
+        json={'current_iteration_number': 1, 'name': 'foo'},
+    )
+    mocked_responses.add(
+        responses.GET,
+        _iteration_url(1),
+        match=[ITERATION_FIELDS],
+        json={'velocity': 10, 'stories': []},
+    )
+    mocked_responses.add(
+        responses.GET,
+        PROJECT_URL,
+        status=304,
+    )
+
+    first = service.update()
+    second = service.update()
+
+    assert second is first
+    assert len(mocked_responses.calls) == 3
+    assert 'If-None-Match' not in mocked_responses.calls[0].request.headers
+    assert mocked_responses.calls[2].request.headers['If-None-Match'] == '"abc123"'
+
+
+def test_session_drops_cookies(mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        PROJECT_URL,
+        status=401,
+        adding_headers={'Set-Cookie': 'sess=user-a; Path=/'},
+    )
+    mocked_responses.add(
+        responses.GET,
+        'https://www.pivotaltracker.com/services/v5/projects/456',
+        status=401,
+    )
+
+    Tracker(api_token='a', project_id=123).update()
+    Tracker(api_token='b', project_id=456).update()
+
+    assert 'Cookie' not in mocked_responses.calls[1].request.headers
+
+
+def test_update_records_iteration(service, mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        PROJECT_URL,
+        adding_headers={'X-Tracker-Project-Version': '1'},
+        json={'current_iteration_number': 1, 'name': 'foo'},
+    )
+    mocked_responses.add(
+        responses.GET,
+        _iteration_url(1),
+        match=[ITERATION_FIELDS],
+        json={'velocity': 10, 'stories': []},
+    )
 
-    if get_details:
-        assert len(mocked_responses.calls) == 2
-        assert result == dict(name=name, velocity='unknown', stories={})
-    else:
-        assert len(mocked_responses.calls) == 1
-        assert result is service._cached
+    first = service.update()
+    mocked_responses.calls.reset()
+    second = service.update()
+
+    assert service.current_iteration == 1
+    assert len(mocked_responses.calls) == 1
+    assert second is first is service._cached
+
+
+@pytest.mark.parametrize('etag_headers', [{}, {'ETag': '"abc123"'}], ids=['no-etag', 'etag'])
+def test_update_retries_failed_details(service, mocked_responses, etag_headers):
+    for _ in range(2):
+        mocked_responses.add(responses.GET, PROJECT_URL,
+            adding_headers=dict(etag_headers, **{'X-Tracker-Project-Version': '1'}),
+            json={'current_iteration_number': 1, 'name': 'foo'})
+    mocked_responses.add(responses.GET, _iteration_url(1), match=[ITERATION_FIELDS], status=503)
+    mocked_responses.add(responses.GET, _iteration_url(1), match=[ITERATION_FIELDS],
+        json={'velocity': 10, 'stories': []})
+
+    first = service.update()
+    second = service.update()
+
+    assert first == {'name': 'foo'}
+    assert second == {'name': 'foo', 'velocity': 10, 'stories': {}}
+    assert 'If-None-Match' not in mocked_responses.calls[2].request.headers
+    assert service.current_iteration == 1
+    assert service._cached is second
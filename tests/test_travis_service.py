@@ -1,24 +1,64 @@
 import logging
+from types import MappingProxyType
 
 import pytest
 import responses
 
 from flash_services.core import Service
-from flash_services.travis import TravisOS
+from flash_services.travis import SESSION, TravisOS, TravisPro
 
 
-@pytest.fixture
-def service():
-    return TravisOS(account='foo', app='bar')
+@pytest.fixture(scope='module', params=[
+    (TravisOS, {}),
+    (TravisPro, {'api_token': 'some_token'}),
+], ids=['TravisOS', 'TravisPro'])
+def service(request):
+    service_class, config = request.param
+    return service_class(account='foo', app='bar', **config)
 
-HEADERS = {
-    'Accept': 'application/vnd.travis-ci.2+json',
-    'User-Agent': 'Flash',
-}
+
+@pytest.fixture(scope='module')
+def url(service):
+    return '{}/repos/foo/bar/builds'.format(service.ROOT)
 
 
-def test_tracker_service_type():
-    assert issubclass(TravisOS, Service)
+HEADERS = MappingProxyType({
+    'Accept': 'application/vnd.travis-ci.2+json',
+    'User-Agent': 'Flash',
+})
+
+PRO_HEADERS = MappingProxyType(dict(HEADERS, Authorization='token "some_token"'))
+
+PASSED_RESPONSE = dict(
+    builds=[dict(
+        commit_id=123456,
+        finished_at='2016-04-14T20:57:07Z',
+        started_at='2016-04-14T20:47:40Z',
+        state='passed',
+    )],
+    commits=[dict(
+        author_name='alice',
+        id=123456,
+        message='hello world',
+    )],
+)
+
+UNFINISHED_RESPONSE = dict(
+    builds=[dict(
+        commit_id=123456,
+        state='garbage',
+    )],
+    commits=[dict(
+        author_name='alice',
+        id=123456,
+        message='some much longer message',
+    )],
+)
+
+
+@pytest.mark.parametrize('service_class', [TravisOS, TravisPro])
+def test_tracker_service_type(service_class):
+    assert issubclass(service_class, Service)
 
 
 def test_correct_config():
@@ -27,66 +67,50 @@ def test_correct_config():
     assert TravisOS.TEMPLATE == 'ci-section'
 
 
-def test_correct_headers(service):
-    assert service.headers == HEADERS
+def test_correct_pro_config():
+    assert TravisPro.REQUIRED == {'api_token', 'app', 'account'}
+    assert TravisPro.ROOT == 'https://api.travis-ci.com'
+    assert TravisPro.TEMPLATE == 'ci-section'
 
 
-def test_update_success(service, caplog, mocked_responses):
-    caplog.set_level(logging.DEBUG)
-    mocked_responses.add(
-        responses.GET,
-        'https://api.travis-ci.org/repos/foo/bar/builds',
-        json={},
+def test_session_shared():
+    assert (
+        TravisOS(account='foo', app='bar').session
+        is TravisPro(account='foo', app='bar', api_token='baz').session
+        is SESSION
     )
 
+
+@pytest.mark.parametrize('service_class, config, expected', [
+    (TravisOS, {}, HEADERS),
+    (TravisPro, {'api_token': 'some_token'}, PRO_HEADERS),
+])
+def test_correct_headers(service_class, config, expected):
+    assert service_class(account='foo', app='bar', **config).headers == expected
+
+
+def test_update_success(service, url, mocked_responses, log_index):
+    mocked_responses.add(responses.GET, url, body=b'{}', content_type='application/json')
+
     result = service.update()
 
-    assert 'fetching Travis CI project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.DEBUG
-    ]
+    assert 'fetching Travis CI project data' in log_index()[logging.DEBUG]
     assert result == {'builds': [], 'name': 'foo/bar', 'health': 'neutral'}
-    for key in HEADERS:
-        assert mocked_responses.calls[0].request.headers[key] == HEADERS[key]
+    for key, value in service.headers.items():
+        assert mocked_responses.calls[0].request.headers[key] == value
 
 
-def test_update_failure(service, caplog, mocked_responses):
-    mocked_responses.add(
-        responses.GET,
-        'https://api.travis-ci.org/repos/foo/bar/builds',
-        status=401,
-    )
+def test_update_failure(service, url, log_index, mocked_responses):
+    mocked_responses.add(responses.GET, url, status=401)
 
     result = service.update()
 
-    assert 'failed to update Travis CI project data' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.ERROR
-    ]
+    assert 'failed to update Travis CI project data' in log_index()[logging.ERROR]
     assert result == {}
 
 
-def test_formatting(service, mocked_responses):
-    response = dict(
-        builds=[dict(
-            commit_id=123456,
-            finished_at='2016-04-14T20:57:07Z',
-            started_at='2016-04-14T20:47:40Z',
-            state='passed',
-        )],
-        commits=[dict(
-            author_name='alice',
-            id=123456,
-            message='hello world',
-        )],
-    )
-    mocked_responses.add(
-        responses.GET,
-        'https://api.travis-ci.org/repos/foo/bar/builds',
-        json=response,
-    )
+def test_formatting(service, url, mocked_responses):
+    mocked_responses.add(responses.GET, url, json=PASSED_RESPONSE)
 
     result = service.update()
 
@@ -104,23 +128,8 @@ def test_formatting(service, mocked_responses):
     )
 
 
-def test_unfinished_formatting(service, caplog, mocked_responses):
-    response = dict(
-        builds=[dict(
-            commit_id=123456,
-            state='garbage',
-        )],
-        commits=[dict(
-            author_name='alice',
-            id=123456,
-            message='some much longer message',
-        )],
-    )
-    mocked_responses.add(
-        responses.GET,
-        'https://api.travis-ci.org/repos/foo/bar/builds',
-        json=response,
-    )
+def test_unfinished_formatting(service, url, log_index, mocked_responses):
+    mocked_responses.add(responses.GET, url, json=UNFINISHED_RESPONSE)
 
     result = service.update()
 
@@ -136,8 +145,4 @@ def test_unfinished_formatting(service, caplog, mocked_responses):
         )],
         health='neutral',
     )
-    assert 'unknown outcome: garbage' in [
-        record.getMessage()
-        for record in caplog.records
-        if record.levelno == logging.WARN
-    ]
+    assert 'unknown outcome: garbage' in log_index()[logging.WARN]